@@ -14,7 +14,7 @@ from core.utils.image_inputs import (
     format_missing_image_marker,
     format_remote_image_ref_marker,
 )
-from core.tools.utils import estimate_token_count
+from core.tools.utils import count_tokens_up_to, token_count_upper_bound
 
 from .markdown import MarkdownChunk
 from .policy import ChunkingPolicy
@@ -113,14 +113,17 @@ def evaluate_markdown_image_policy(
     - If raw markdown text exceeds auto-cache token limit, skip multimodal attachments.
     - Attach images only if all deduped local images satisfy policy limits.
     """
-    if auto_cache_max_tokens > 0:
-        raw_text_tokens = estimate_token_count(file_content)
+    if (
+        auto_cache_max_tokens > 0
+        and token_count_upper_bound(file_content) > auto_cache_max_tokens
+    ):
+        raw_text_tokens = count_tokens_up_to(file_content, auto_cache_max_tokens)
         if raw_text_tokens > auto_cache_max_tokens:
             return MarkdownImageDecision(
                 attach_images=False,
                 reason=(
                     "raw text exceeds auto-cache limit "
-                    f"({raw_text_tokens} > {auto_cache_max_tokens})"
+                    f"(> {auto_cache_max_tokens} tokens)"
                 ),
                 normalized_text=normalize_embedded_image_refs(
                     markdown_chunks=markdown_chunks,
@@ -229,7 +229,10 @@ def build_input_files_prompt(
                 _append_text(parts, text_lines, f"{content}\n")
                 continue
 
-            markdown_chunks: List[MarkdownChunk] = parse_markdown_chunks(content)
+            # Callers that already parsed this content may pass its chunks.
+            markdown_chunks: Optional[List[MarkdownChunk]] = item.get("markdown_chunks")
+            if markdown_chunks is None:
+                markdown_chunks = parse_markdown_chunks(content)
             if not markdown_chunks:
                 _append_text(parts, text_lines, f"{content}\n")
                 continue
@@ -624,6 +624,20 @@ def get_file_ops_safe_list_max_results() -> int:
     return parsed if parsed >= 0 else template_default
 
 
+def get_file_ops_safe_search_max_results() -> int:
+    """Return max matching lines for file_ops_safe search (0 disables the cap)."""
+    entry = get_general_settings().get("file_ops_safe_search_max_results")
+    value = getattr(entry, "value", None) if entry is not None else None
+    template_default = _get_template_setting_positive_int(
+        "file_ops_safe_search_max_results", 100
+    )
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return template_default
+    return parsed if parsed >= 0 else template_default
+
+
 def get_debug_enabled() -> bool:
     """Return whether diagnostic debug behavior is enabled."""
     entry = get_general_settings().get("debug")
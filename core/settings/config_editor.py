@@ -7,6 +7,7 @@ sections (tools, core providers).
 """
 
 import json
+import re
 from typing import Optional
 
 import yaml
@@ -23,6 +24,10 @@ from core.settings.store import (
 from . import SettingsError, refresh_configuration_status_cache
 
 
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+
 def _persist_changes(settings_file) -> None:
     """Persist settings to disk and refresh related caches."""
     save_settings(settings_file)
@@ -49,15 +54,18 @@ def update_general_setting(name: str, raw_value: str) -> SettingsEntry:
         raise SettingsError(f"Setting '{name}' does not exist.")
 
     coerced_value = _coerce_setting_value(raw_value, entry.value)
-    settings_file.settings[name] = SettingsEntry(
+    candidate = SettingsEntry(
         value=coerced_value,
         description=entry.description,
         category=entry.category,
         restart_required=entry.restart_required,
     )
+    if settings_file.settings.get(name) == candidate:
+        return candidate
 
+    settings_file.settings[name] = candidate
     _persist_changes(settings_file)
-    return settings_file.settings[name]
+    return candidate
 
 
 def _template_general_settings() -> dict[str, SettingsEntry]:
@@ -90,16 +98,16 @@ def _coerce_setting_value(raw_value: str, current_value):
         raise SettingsError("Value must be true or false.")
 
     if isinstance(current_value, int) and not isinstance(current_value, bool):
-        try:
-            return int(raw_value.strip())
-        except ValueError as exc:
-            raise SettingsError("Value must be an integer.") from exc
+        stripped = raw_value.strip()
+        if not _INT_RE.fullmatch(stripped):
+            raise SettingsError("Value must be an integer.")
+        return int(stripped)
 
     if isinstance(current_value, float):
-        try:
-            return float(raw_value.strip())
-        except ValueError as exc:
-            raise SettingsError("Value must be a number.") from exc
+        stripped = raw_value.strip()
+        if not _FLOAT_RE.fullmatch(stripped):
+            raise SettingsError("Value must be a number.")
+        return float(stripped)
 
     if current_value is None:
         return raw_value or None
@@ -158,7 +166,7 @@ def upsert_model_mapping(
         else list(getattr(existing, "capabilities", ["text"])) if existing else ["text"]
     )
 
-    settings_file.models[name] = ModelConfig(
+    candidate = ModelConfig(
         provider=provider,
         model_string=model_string,
         capabilities=resolved_capabilities,
@@ -166,9 +174,12 @@ def upsert_model_mapping(
         description=description,
         user_editable=user_editable,
     )
+    if existing == candidate:
+        return existing
 
+    settings_file.models[name] = candidate
     _persist_changes(settings_file)
-    return settings_file.models[name]
+    return candidate
 
 
 def delete_model_mapping(name: str) -> None:
@@ -204,14 +215,17 @@ def upsert_provider_config(
 
     user_editable = getattr(existing, "user_editable", True) if existing else True
 
-    settings_file.providers[name] = ProviderConfig(
+    candidate = ProviderConfig(
         api_key=api_key,
         base_url=base_url,
         user_editable=user_editable,
     )
+    if existing == candidate:
+        return existing
 
+    settings_file.providers[name] = candidate
     _persist_changes(settings_file)
-    return settings_file.providers[name]
+    return candidate
 
 
 def delete_provider_config(name: str) -> None:
@@ -9,11 +9,11 @@ managed independently from infrastructure configuration.
 from __future__ import annotations
 
 import os
+import re
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
-from collections import OrderedDict
 
 import yaml
 
@@ -23,6 +23,10 @@ from core.runtime.paths import get_system_root
 SECRETS_PATH_ENV = "SECRETS_PATH"
 SECRETS_TEMPLATE = Path(__file__).parent / "secrets.template.yaml"
 
+# Secrets paths already confirmed to exist, so steady-state reads skip the
+# mkdir/exists/template checks.
+_ENSURED_PATHS: set[Path] = set()
+
 
 class _SecretsDumper(yaml.SafeDumper):
     """Custom YAML dumper that renders None values as empty strings."""
@@ -34,6 +38,13 @@ def _represent_none(self, _):  # type: ignore[override]
 
 _SecretsDumper.add_representer(type(None), _represent_none)
 
+# Scalars matching this pattern (and not a YAML 1.1 keyword) load back as the
+# same plain string, so they can be emitted without a full YAML dump.
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z][A-Za-z0-9_./+=-]*")
+_YAML_KEYWORDS = frozenset(
+    {"true", "false", "yes", "no", "on", "off", "null", "y", "n"}
+)
+
 
 @dataclass(frozen=True)
 class SecretEntry:
@@ -60,26 +71,43 @@ def _resolve_secrets_path() -> Path:
 
 def _ensure_file(path: Path) -> None:
     """Ensure the secrets file exists."""
+    if path in _ENSURED_PATHS:
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
-    if not path.exists():
-        if SECRETS_TEMPLATE.exists():
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        try:
             shutil.copyfile(SECRETS_TEMPLATE, path)
-        else:
+        except FileNotFoundError:
+            # Template not shipped; start from an empty store.
             path.write_text("", encoding="utf-8")
+    _ENSURED_PATHS.add(path)
 
 
-def _read_raw(path: Path, include_empty: bool = False) -> "OrderedDict[str, Optional[str]]":
+def _load_yaml(path: Path) -> object:
+    """Parse the secrets file straight from a binary handle."""
+    with open(path, "rb") as handle:
+        return yaml.safe_load(handle)
+
+
+def _read_raw(path: Path, include_empty: bool = False) -> Dict[str, Optional[str]]:
     """Read raw secrets mapping from disk."""
     _ensure_file(path)
-    raw_text = path.read_text(encoding="utf-8")
-    if not raw_text.strip():
-        return OrderedDict()
+    try:
+        data = _load_yaml(path)
+    except FileNotFoundError:
+        # File was removed after it was first ensured; re-seed it.
+        _ENSURED_PATHS.discard(path)
+        _ensure_file(path)
+        data = _load_yaml(path)
+    if not data:
+        return {}
 
-    data = yaml.safe_load(raw_text) or {}
     if not isinstance(data, dict):
         raise ValueError("Secrets file must contain a mapping of key/value pairs.")
 
-    normalized: "OrderedDict[str, Optional[str]]" = OrderedDict()
+    normalized: Dict[str, Optional[str]] = {}
     for key, value in data.items():
         if not isinstance(key, str):
             raise ValueError("Secret names must be strings.")
@@ -93,15 +121,42 @@ def _read_raw(path: Path, include_empty: bool = False) -> "OrderedDict[str, Opti
     return normalized
 
 
+def _is_plain_scalar(text: str) -> bool:
+    return (
+        _PLAIN_SCALAR_RE.fullmatch(text) is not None
+        and text.lower() not in _YAML_KEYWORDS
+    )
+
+
+def _emit_flat_yaml(data: Dict[str, Optional[str]]) -> Optional[str]:
+    """
+    Render a flat secrets mapping as YAML without invoking the dumper.
+
+    Returns None when any key or value needs quoting, so the caller can fall
+    back to PyYAML.
+    """
+    lines: List[str] = []
+    for key, value in data.items():
+        if not _is_plain_scalar(key):
+            return None
+        if value is None:
+            lines.append(f"{key}:")
+        elif _is_plain_scalar(value):
+            lines.append(f"{key}: {value}")
+        else:
+            return None
+    return "\n".join(lines) + "\n"
+
+
 def _write_raw(path: Path, data: Dict[str, Optional[str]]) -> None:
     """Persist secrets mapping to disk using an atomic write."""
     _ensure_file(path)
     tmp_path = path.with_suffix(".tmp")
+    payload = _emit_flat_yaml(data) if data else ""
     with open(tmp_path, "w", encoding="utf-8") as handle:
-        if data:
-            serializable = dict(data)
+        if payload is None:
             yaml.dump(
-                serializable,
+                dict(data),
                 handle,
                 sort_keys=False,
                 default_flow_style=False,
@@ -109,7 +164,7 @@ def _write_raw(path: Path, data: Dict[str, Optional[str]]) -> None:
                 Dumper=_SecretsDumper,
             )
         else:
-            handle.write("")
+            handle.write(payload)
     os.replace(tmp_path, path)
 
 
@@ -21,6 +21,12 @@ from core.runtime.paths import get_system_root
 
 SETTINGS_TEMPLATE = Path(__file__).parent / "settings.template.yaml"
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it.
+_SETTINGS_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Settings paths already confirmed to exist; cleared by refresh_settings_cache().
+_ENSURED_SETTINGS_PATHS: set[Path] = set()
+
 
 class SettingsEntry(BaseModel):
     """Single general settings entry."""
@@ -117,15 +123,25 @@ def _resolve_settings_path() -> Path:
 
 def _ensure_settings_file(target_path: Path) -> None:
     """Ensure the settings file exists at the target path, seeding from template if missing."""
+    if target_path in _ENSURED_SETTINGS_PATHS:
+        return
+
     target_path.parent.mkdir(parents=True, exist_ok=True)
 
     if target_path.exists():
+        _ENSURED_SETTINGS_PATHS.add(target_path)
         return
 
     if not SETTINGS_TEMPLATE.exists():
         raise FileNotFoundError(f"Default settings template missing: {SETTINGS_TEMPLATE}")
 
     shutil.copyfile(SETTINGS_TEMPLATE, target_path)
+    _ENSURED_SETTINGS_PATHS.add(target_path)
+
+
+def _read_settings_yaml(settings_file: Path) -> dict[str, Any]:
+    with open(settings_file, "r", encoding="utf-8") as handle:
+        return yaml.safe_load(handle) or {}
 
 
 @lru_cache(maxsize=1)
@@ -138,8 +154,13 @@ def load_settings() -> SettingsFile:
     """
     settings_file = get_active_settings_path()
 
-    with open(settings_file, "r", encoding="utf-8") as handle:
-        raw_data = yaml.safe_load(handle) or {}
+    try:
+        raw_data = _read_settings_yaml(settings_file)
+    except FileNotFoundError:
+        # File was removed after it was first ensured; re-seed it.
+        _ENSURED_SETTINGS_PATHS.discard(settings_file)
+        _ensure_settings_file(settings_file)
+        raw_data = _read_settings_yaml(settings_file)
 
     for section in ("settings", "models", "providers", "tools"):
         if raw_data.get(section) is None:
@@ -154,6 +175,7 @@ def load_settings() -> SettingsFile:
 def refresh_settings_cache() -> None:
     """Clear the settings cache so future calls reload from disk."""
     load_settings.cache_clear()  # type: ignore[attr-defined]
+    _ENSURED_SETTINGS_PATHS.clear()
 
 
 def save_settings(settings: SettingsFile) -> None:
@@ -161,11 +183,22 @@ def save_settings(settings: SettingsFile) -> None:
     path = get_active_settings_path()
     data = settings.model_dump(mode="python")
 
+    # Serialize fully before touching disk so the temp file is written in one go.
+    payload = yaml.dump(
+        data,
+        Dumper=_SETTINGS_DUMPER,
+        sort_keys=False,
+        default_flow_style=False,
+        allow_unicode=False,
+    )
+
     tmp_path = path.with_suffix(".tmp")
     path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(tmp_path, "w", encoding="utf-8") as handle:
-        yaml.safe_dump(data, handle, sort_keys=False, allow_unicode=False)
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
 
     os.replace(tmp_path, path)
 
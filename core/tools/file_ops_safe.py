@@ -5,14 +5,22 @@ Provides secure file management capabilities within vault boundaries.
 """
 
 import os
+import fnmatch
 import glob
+import mimetypes
+import re
+import stat
 import subprocess
+import tempfile
+import threading
 from bisect import insort
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic_ai.messages import BinaryContent, ToolReturn
+from pydantic_ai.messages import ToolReturn
 from pydantic_ai.tools import Tool
 
 from core.chunking import (
@@ -28,6 +36,7 @@ from core.settings import (
     get_chunking_max_image_bytes_per_image,
     get_chunking_max_image_mb_per_image,
     get_file_ops_safe_list_max_results,
+    get_file_ops_safe_search_max_results,
     get_file_search_timeout_seconds,
 )
 from core.utils.image_inputs import build_image_tool_payload
@@ -39,6 +48,9 @@ from core.vault_state.file_mutations import (
 )
 from .base import BaseTool
 from .utils import (
+    has_parent_reference,
+    is_within_root,
+    resolve_vault_root,
     validate_and_resolve_path,
     resolve_virtual_path,
     get_virtual_mount_key,
@@ -47,6 +59,18 @@ from .utils import (
 
 logger = UnifiedLogger(tag="file-ops-safe-tool")
 
+# Long matching lines are previewed rather than returned whole.
+_SEARCH_MAX_COLUMNS = 500
+
+_GLOB_CHARS = frozenset("*?[")
+_SUPPORTED_READ_EXTENSIONS = ", ".join(sorted(SUPPORTED_READ_FILE_TYPES))
+
+
+@lru_cache(maxsize=256)
+def _compile_glob_segment(segment: str) -> Callable[[str], re.Match | None]:
+    """Return a compiled match function for one wildcard path segment."""
+    return re.compile(fnmatch.translate(segment)).match
+
 
 class FileOpsSafe(BaseTool):
     """Safe file operations tool with vault boundary enforcement."""
@@ -58,6 +82,13 @@ class FileOpsSafe(BaseTool):
         :param vault_path: Path to vault for file operations scope
         """
 
+        # Invocation log fields are fixed per tool instance; build them once.
+        validation_log = logger.set_sinks(["validation"])
+        invocation_data = {
+            "tool": "file_ops_safe",
+            "vault": vault_path.rstrip("/").split("/")[-1] if vault_path else None,
+        }
+
         def file_operations(
             *,
             operation: str,
@@ -81,13 +112,7 @@ class FileOpsSafe(BaseTool):
             :param limit: Number of lines to return (head operation)
             """
             try:
-                logger.set_sinks(["validation"]).info(
-                    "tool_invoked",
-                    data={
-                        "tool": "file_ops_safe",
-                        "vault": vault_path.rstrip("/").split("/")[-1] if vault_path else None,
-                    },
-                )
+                validation_log.info("tool_invoked", data=invocation_data)
                 if not vault_path:
                     raise ValueError("vault_path is required for file operations")
 
@@ -222,15 +247,15 @@ Full documentation:
         mount_key = get_virtual_mount_key(path)
         if mount_key:
             raise ValueError(f"'{mount_key}' is reserved for a virtual mount")
-        if ".." in path:
+        if has_parent_reference(path):
             raise ValueError("Path traversal not allowed - '..' found in path")
         if path.startswith("/"):
             raise ValueError("Absolute paths not allowed")
 
         full_path = os.path.join(vault_path, path)
         resolved_path = os.path.realpath(full_path)
-        vault_abs = os.path.realpath(vault_path)
-        if not resolved_path.startswith(vault_abs + os.sep) and resolved_path != vault_abs:
+        vault_abs = resolve_vault_root(vault_path)
+        if not is_within_root(resolved_path, vault_abs):
             raise ValueError("Path escapes vault boundaries")
         return resolved_path
 
@@ -240,14 +265,26 @@ Full documentation:
         path = path.strip()
         full_path = cls._validate_read_path(path, vault_path)
 
+        stat_result = None
         if cls._should_try_markdown_file(path):
             markdown_path = f"{path}.md"
             markdown_full_path = cls._validate_read_path(markdown_path, vault_path)
-            if os.path.isfile(markdown_full_path):
+            try:
+                markdown_stat = os.stat(markdown_full_path)
+            except OSError:
+                markdown_stat = None
+            if markdown_stat is not None and stat.S_ISREG(markdown_stat.st_mode):
                 path = markdown_path
                 full_path = markdown_full_path
+                stat_result = markdown_stat
 
-        if os.path.isdir(full_path):
+        if stat_result is None:
+            try:
+                stat_result = os.stat(full_path)
+            except (FileNotFoundError, NotADirectoryError):
+                return cls._file_not_found_result(path)
+
+        if stat.S_ISDIR(stat_result.st_mode):
             if cls._should_try_markdown_file(path):
                 return cls._list_files(
                     path,
@@ -257,30 +294,12 @@ Full documentation:
                 )
             return cls._directory_read_error(path)
 
-        if not os.path.exists(full_path) and cls._should_try_markdown_file(path):
-            directory_full_path = cls._validate_read_path(path, vault_path)
-            if os.path.isdir(directory_full_path):
-                return cls._list_files(
-                    path,
-                    vault_path,
-                    recursive=False,
-                    max_results=get_file_ops_safe_list_max_results(),
-                )
-
-        if not os.path.exists(full_path):
-            return cls._result(
-                message=(
-                    f"Cannot read '{path}' - file does not exist. "
-                    "Use file_ops_safe(operation='list') to see available files."
-                ),
-                operation="read",
-                path=path,
-                status="not_found",
-                exists=False,
-                error_type="file_not_found",
-            )
-
-        return cls._read_existing_file(path, full_path, vault_path)
+        return cls._read_existing_file(
+            path,
+            full_path,
+            vault_path,
+            size_bytes=stat_result.st_size,
+        )
 
     @classmethod
     def _should_try_markdown_file(cls, path: str) -> bool:
@@ -304,28 +323,35 @@ Full documentation:
         )
 
     @classmethod
-    def _read_existing_file(cls, path: str, full_path: str, vault_path: str) -> str | ToolReturn:
-        """Read a resolved non-directory file path."""
-        if not os.path.exists(full_path):
-            return cls._result(
-                message=(
-                    f"Cannot read '{path}' - file does not exist. "
-                    "Use file_ops_safe(operation='list') to see available files."
-                ),
-                operation="read",
-                path=path,
-                status="not_found",
-                exists=False,
-                error_type="file_not_found",
-            )
+    def _file_not_found_result(cls, path: str) -> ToolReturn:
+        return cls._result(
+            message=(
+                f"Cannot read '{path}' - file does not exist. "
+                "Use file_ops_safe(operation='list') to see available files."
+            ),
+            operation="read",
+            path=path,
+            status="not_found",
+            exists=False,
+            error_type="file_not_found",
+        )
 
-        extension = Path(full_path).suffix.lower()
+    @classmethod
+    def _read_existing_file(
+        cls,
+        path: str,
+        full_path: str,
+        vault_path: str,
+        *,
+        size_bytes: int,
+    ) -> str | ToolReturn:
+        """Read a resolved non-directory file path whose size is already known."""
+        extension = os.path.splitext(full_path)[1].lower()
         if extension not in SUPPORTED_READ_FILE_TYPES:
-            allowed = ", ".join(sorted(SUPPORTED_READ_FILE_TYPES.keys()))
             return cls._result(
                 message=(
                     f"Cannot read '{path}' - unsupported file type '{extension or '[none]'}'. "
-                    f"Supported extensions: {allowed}."
+                    f"Supported extensions: {_SUPPORTED_READ_EXTENSIONS}."
                 ),
                 operation="read",
                 path=path,
@@ -335,15 +361,19 @@ Full documentation:
                 metadata={"extension": extension or "[none]"},
             )
 
-        binary_content = BinaryContent.from_path(full_path)
-        if binary_content.is_image:
+        # Same media type inference as BinaryContent.from_path, without the read.
+        media_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        if (
+            SUPPORTED_READ_FILE_TYPES[extension] == "image"
+            and media_type.startswith("image/")
+        ):
+            # Gate on the stat size so oversized images are rejected before any read.
             max_image_bytes = get_chunking_max_image_bytes_per_image()
-            image_size_bytes = len(binary_content.data)
-            if max_image_bytes > 0 and image_size_bytes > max_image_bytes:
+            if max_image_bytes > 0 and size_bytes > max_image_bytes:
                 max_image_mb = get_chunking_max_image_mb_per_image()
                 return cls._result(
                     message=(
-                        f"Cannot attach image '{path}' ({image_size_bytes} bytes) - exceeds "
+                        f"Cannot attach image '{path}' ({size_bytes} bytes) - exceeds "
                         f"chunking_max_image_mb_per_image ({max_image_mb} MB)."
                     ),
                     operation="read",
@@ -353,7 +383,7 @@ Full documentation:
                     error_type="image_too_large",
                     metadata={
                         "media_mode": "image",
-                        "size_bytes": image_size_bytes,
+                        "size_bytes": size_bytes,
                     },
                 )
             payload = build_image_tool_payload(
@@ -374,21 +404,21 @@ Full documentation:
             )
 
         try:
-            with open(full_path, 'r', encoding='utf-8') as file:
-                file_content = file.read()
+            file_content = cls._read_utf8_text(full_path)
         except UnicodeDecodeError:
             return cls._result(
                 message=(
-                    f"Cannot read '{path}' as text - this file is binary ({binary_content.media_type}). "
-                    "Image files are supported for multimodal reading; other binary types are not supported by "
-                    "file_ops_safe(read) yet."
+                    f"Cannot read '{path}' as text - "
+                    f"this file is binary ({media_type}). "
+                    "Image files are supported for multimodal reading; "
+                    "other binary types are not supported by file_ops_safe(read) yet."
                 ),
                 operation="read",
                 path=path,
                 status="unsupported",
                 exists=True,
                 error_type="binary_file",
-                metadata={"media_type": binary_content.media_type},
+                metadata={"media_type": media_type},
             )
         if SUPPORTED_READ_FILE_TYPES.get(extension) != "markdown":
             return cls._result(
@@ -405,13 +435,17 @@ Full documentation:
         markdown_chunks = parse_markdown_chunks(file_content)
         has_embedded_images = any(chunk.kind == "image_ref" for chunk in markdown_chunks)
         if has_embedded_images:
+            # The prompt builder re-evaluates with these same values, so both
+            # decisions agree on whether images are attached.
+            policy = default_chunking_policy()
+            auto_cache_max_tokens = get_auto_cache_max_tokens()
             decision = evaluate_markdown_image_policy(
                 file_content=file_content,
                 markdown_chunks=markdown_chunks,
                 source_markdown_path=path,
                 vault_path=vault_path,
-                auto_cache_max_tokens=get_auto_cache_max_tokens(),
-                policy=default_chunking_policy(),
+                auto_cache_max_tokens=auto_cache_max_tokens,
+                policy=policy,
             )
             if not decision.attach_images:
                 return cls._result(
@@ -438,11 +472,14 @@ Full documentation:
                         "found": True,
                         "error": None,
                         "images_policy": "auto",
+                        "markdown_chunks": markdown_chunks,
                     }
                 ],
                 vault_path=vault_path,
                 include_file_framing=False,
                 supports_vision=None,
+                policy=policy,
+                auto_cache_max_tokens=auto_cache_max_tokens,
             )
             if isinstance(built.prompt, list):
                 return ToolReturn(
@@ -526,7 +563,12 @@ Full documentation:
 
         full_path, _mount = resolve_virtual_path(f"{mount_key}/{rel}")
 
-        if os.path.isdir(full_path):
+        try:
+            stat_result = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            stat_result = None
+
+        if stat_result is not None and stat.S_ISDIR(stat_result.st_mode):
             return cls._result(
                 message=(
                     f"Cannot read '{path}' - this is a directory, not a file. "
@@ -539,7 +581,7 @@ Full documentation:
                 error_type="is_directory",
             )
 
-        if not os.path.exists(full_path):
+        if stat_result is None:
             return cls._result(
                 message=f"Cannot read '{path}' - file does not exist.",
                 operation="read",
@@ -549,8 +591,11 @@ Full documentation:
                 error_type="file_not_found",
             )
 
-        with open(full_path, 'r', encoding='utf-8') as file:
-            file_content = file.read()
+        file_content = cls._read_virtual_text(
+            full_path,
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+        )
         return cls._result(
             message=file_content,
             operation="read",
@@ -564,6 +609,26 @@ Full documentation:
             },
         )
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _read_virtual_text(full_path: str, mtime_ns: int, size: int) -> str:
+        """Read a virtual mount file, keyed on mtime/size so edits invalidate it."""
+        return FileOpsSafe._read_utf8_text(full_path)
+
+    @staticmethod
+    def _read_utf8_text(full_path: str) -> str:
+        """Read a whole text file as UTF-8 with universal newlines.
+
+        Decodes the file in one ``bytes.decode`` call instead of through the
+        incremental ``TextIOWrapper`` decoder, then applies the same newline
+        translation text mode would.
+        """
+        with open(full_path, 'rb') as file:
+            text = file.read().decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
     @classmethod
     def _write_file(cls, path: str, content: str, vault_path: str) -> str:
         """Write new file (fails if exists)."""
@@ -704,19 +769,18 @@ Full documentation:
         if not path or path == ".":
             path = "**/*" if recursive else "*"
 
-        if '..' in path or path.startswith('/'):
+        if has_parent_reference(path) or path.startswith('/'):
             raise ValueError("Path cannot contain '..' or start with '/'")
 
-        is_glob = any(ch in path for ch in "*?[")
+        is_glob = not _GLOB_CHARS.isdisjoint(path)
         if not is_glob:
             abs_path = os.path.join(vault_path, path)
             if os.path.isdir(abs_path):
                 scope_relative_path = cls._relative_vault_path(vault_path, abs_path)
                 path = os.path.join(path, "**/*" if recursive else "*")
 
-        full_pattern = os.path.join(vault_path, path)
         files, directories, file_count, directory_count = cls._collect_limited_matches(
-            pattern=full_pattern,
+            pattern=path,
             recursive=recursive or "**" in path,
             root_path=vault_path,
             max_results=max_results,
@@ -756,9 +820,11 @@ Full documentation:
 
         result_parts = []
         if directories:
-            result_parts.append(f"Directories ({len(directories)}):\n" + '\n'.join(f"  📁 {d}/" for d in directories))
+            directory_lines = '\n'.join([f"  📁 {d}/" for d in directories])
+            result_parts.append(f"Directories ({len(directories)}):\n{directory_lines}")
         if files:
-            result_parts.append(f"Files ({len(files)}):\n" + '\n'.join(f"  📄 {f}" for f in files))
+            file_lines = '\n'.join([f"  📄 {f}" for f in files])
+            result_parts.append(f"Files ({len(files)}):\n{file_lines}")
         if truncated:
             result_parts.append(f"... truncated to {max_results} results. Narrow your path or disable recursion.")
 
@@ -784,6 +850,190 @@ Full documentation:
         relative = os.path.relpath(full_path, vault_path)
         return "" if relative == "." else relative.replace(os.sep, "/")
 
+    @classmethod
+    def _iter_glob_entries(
+        cls,
+        root_path: str,
+        pattern: str,
+        *,
+        recursive: bool,
+    ) -> Iterator[tuple[str, bool]]:
+        """Yield (relative_path, is_dir) for visible entries matching a relative glob.
+
+        Walks with os.scandir so directory checks reuse the dirent type. Only
+        symlinks are resolved; they are skipped when they leave the root, and
+        '**' does not descend into links that point back at an ancestor.
+        """
+        segments = [part for part in pattern.split("/") if part not in ("", ".")]
+        if not segments:
+            return
+        root_abs = os.path.realpath(root_path)
+        # Look up each wildcard segment's compiled matcher once per walk.
+        segment_matchers = {
+            segment: _compile_glob_segment(segment)
+            for segment in segments
+            if not _GLOB_CHARS.isdisjoint(segment)
+        }
+        yield from cls._walk_glob_segments(
+            dir_path=root_path,
+            dir_real=root_abs,
+            relative_dir="",
+            segments=segments,
+            segment_matchers=segment_matchers,
+            root_abs=root_abs,
+            recursive=recursive,
+            scan_cache={},
+        )
+
+    @classmethod
+    def _walk_glob_segments(
+        cls,
+        *,
+        dir_path: str,
+        dir_real: str,
+        relative_dir: str,
+        segments: list[str],
+        segment_matchers: dict[str, Callable[[str], re.Match | None]],
+        root_abs: str,
+        recursive: bool,
+        scan_cache: dict[str, list[tuple[os.DirEntry, str, bool]]],
+    ) -> Iterator[tuple[str, bool]]:
+        segment, rest = segments[0], segments[1:]
+
+        if recursive and segment == "**":
+            # '**' matches this directory itself and every visible directory below it.
+            if rest:
+                yield from cls._walk_glob_segments(
+                    dir_path=dir_path,
+                    dir_real=dir_real,
+                    relative_dir=relative_dir,
+                    segments=rest,
+                    segment_matchers=segment_matchers,
+                    root_abs=root_abs,
+                    recursive=recursive,
+                    scan_cache=scan_cache,
+                )
+            elif relative_dir:
+                yield relative_dir, True
+            for entry, entry_real, is_dir in cls._scan_visible_entries(
+                dir_path, dir_real, root_abs, scan_cache
+            ):
+                relative_path = (
+                    f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                )
+                if is_dir and is_within_root(dir_real, entry_real):
+                    # Symlink back to an ancestor: list it without descending again.
+                    if not rest:
+                        yield relative_path, True
+                elif is_dir:
+                    yield from cls._walk_glob_segments(
+                        dir_path=entry.path,
+                        dir_real=entry_real,
+                        relative_dir=relative_path,
+                        segments=segments,
+                        segment_matchers=segment_matchers,
+                        root_abs=root_abs,
+                        recursive=recursive,
+                        scan_cache=scan_cache,
+                    )
+                elif not rest:
+                    yield relative_path, False
+            return
+
+        matcher = segment_matchers.get(segment)
+        if matcher is not None:
+            candidates = (
+                (entry.path, entry.name, entry_real, is_dir)
+                for entry, entry_real, is_dir in cls._scan_visible_entries(
+                    dir_path, dir_real, root_abs, scan_cache
+                )
+                if matcher(entry.name)
+            )
+        else:
+            candidates = cls._literal_glob_candidate(
+                dir_path, dir_real, segment, root_abs
+            )
+
+        for child_path, name, child_real, is_dir in candidates:
+            relative_path = f"{relative_dir}/{name}" if relative_dir else name
+            if not rest:
+                yield relative_path, is_dir
+            elif is_dir:
+                yield from cls._walk_glob_segments(
+                    dir_path=child_path,
+                    dir_real=child_real,
+                    relative_dir=relative_path,
+                    segments=rest,
+                    segment_matchers=segment_matchers,
+                    root_abs=root_abs,
+                    recursive=recursive,
+                    scan_cache=scan_cache,
+                )
+
+    @classmethod
+    def _scan_visible_entries(
+        cls,
+        dir_path: str,
+        dir_real: str,
+        root_abs: str,
+        scan_cache: dict[str, list[tuple[os.DirEntry, str, bool]]],
+    ) -> list[tuple[os.DirEntry, str, bool]]:
+        """Return (entry, real_path, is_dir) for visible entries inside the root.
+
+        Results are memoized per walk because '**' patterns revisit each directory.
+        """
+        cached = scan_cache.get(dir_path)
+        if cached is not None:
+            return cached
+        visible: list[tuple[os.DirEntry, str, bool]] = []
+        scan_cache[dir_path] = visible
+        try:
+            with os.scandir(dir_path) as iterator:
+                entries = list(iterator)
+        except OSError:
+            return visible
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_symlink():
+                    entry_real = os.path.realpath(entry.path)
+                    if not is_within_root(entry_real, root_abs):
+                        continue
+                else:
+                    entry_real = os.path.join(dir_real, entry.name)
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            visible.append((entry, entry_real, is_dir))
+        return visible
+
+    @classmethod
+    def _literal_glob_candidate(
+        cls,
+        dir_path: str,
+        dir_real: str,
+        name: str,
+        root_abs: str,
+    ) -> Iterator[tuple[str, str, str, bool]]:
+        """Yield the single child named by a literal glob segment when it is visible."""
+        if name.startswith("."):
+            return
+        child_path = os.path.join(dir_path, name)
+        try:
+            child_stat = os.lstat(child_path)
+        except OSError:
+            return
+        if stat.S_ISLNK(child_stat.st_mode):
+            child_real = os.path.realpath(child_path)
+            if not is_within_root(child_real, root_abs):
+                return
+            is_dir = os.path.isdir(child_path)
+        else:
+            child_real = os.path.join(dir_real, name)
+            is_dir = stat.S_ISDIR(child_stat.st_mode)
+        yield child_path, name, child_real, is_dir
+
     @classmethod
     def _collect_limited_matches(
         cls,
@@ -794,46 +1044,32 @@ Full documentation:
         max_results: int,
     ) -> tuple[list[str], list[str], int, int]:
         """Collect listed paths while bounding retained candidates to the display cap."""
-        root_display = os.path.abspath(root_path)
-        root_abs = os.path.realpath(root_path)
         selected_files: list[str] = []
         selected_directories: list[str] = []
         total_files = 0
         total_directories = 0
 
-        for match in glob.iglob(pattern, recursive=recursive):
-            match_abs = os.path.abspath(match)
-            if not match_abs.startswith(root_display + os.sep) and match_abs != root_display:
-                continue
-
-            relative = os.path.relpath(match_abs, root_display)
-            relative_path = "" if relative == "." else relative.replace(os.sep, "/")
-            parts = relative_path.split(os.sep) if relative_path else []
-            if any(part.startswith('.') for part in parts if part):
-                continue
-
-            try:
-                resolved = os.path.realpath(match)
-            except OSError:
-                continue
-            if not resolved.startswith(root_abs + os.sep) and resolved != root_abs:
-                continue
-
-            if os.path.isdir(match):
-                if relative_path:
-                    total_directories += 1
-                    cls._keep_sorted_candidate(
-                        selected_directories,
-                        relative_path,
-                        max_results,
-                    )
+        for relative_path, is_dir in cls._iter_glob_entries(
+            root_path,
+            pattern,
+            recursive=recursive,
+        ):
+            if is_dir:
+                total_directories += 1
+                cls._keep_sorted_candidate(
+                    selected_directories,
+                    relative_path,
+                    max_results,
+                )
                 continue
 
-            if relative_path:
-                total_files += 1
-                cls._keep_sorted_candidate(selected_files, relative_path, max_results)
+            total_files += 1
+            cls._keep_sorted_candidate(selected_files, relative_path, max_results)
 
-        if max_results > 0 and total_files + total_directories > max_results:
+        if max_results <= 0:
+            selected_files.sort()
+            selected_directories.sort()
+        elif total_files + total_directories > max_results:
             directories = selected_directories[:max_results]
             file_slots = max(0, max_results - min(total_directories, max_results))
             files = selected_files[:file_slots]
@@ -844,7 +1080,8 @@ Full documentation:
     @staticmethod
     def _keep_sorted_candidate(candidates: list[str], value: str, max_results: int) -> None:
         if max_results <= 0:
-            insort(candidates, value)
+            # Uncapped lists are sorted once after the walk instead of per insert.
+            candidates.append(value)
             return
         if len(candidates) < max_results:
             insort(candidates, value)
@@ -906,12 +1143,12 @@ Full documentation:
         normalized = path.strip().lstrip("./")
         rel = normalized[len(mount_key):].lstrip("/")
 
-        if ".." in rel.split(os.sep):
+        if has_parent_reference(rel):
             raise ValueError("Path cannot contain '..' for virtual mounts")
 
         docs_root, _mount = resolve_virtual_path(mount_key)
 
-        is_glob = any(ch in rel for ch in "*?[")
+        is_glob = not _GLOB_CHARS.isdisjoint(rel)
         if not rel:
             rel = "**/*" if recursive else "*"
         elif not is_glob:
@@ -919,9 +1156,8 @@ Full documentation:
             if os.path.isdir(abs_path):
                 rel = os.path.join(rel, "**/*" if recursive else "*")
 
-        full_pattern = os.path.join(docs_root, rel)
         files, directories, file_count, directory_count = cls._collect_limited_matches(
-            pattern=full_pattern,
+            pattern=rel,
             recursive=recursive or "**" in rel,
             root_path=docs_root,
             max_results=max_results,
@@ -950,9 +1186,11 @@ Full documentation:
 
         result_parts = []
         if directories:
-            result_parts.append(f"Directories ({len(directories)}):\n" + '\n'.join(f"  📁 {mount_key}/{d}/" for d in directories))
+            directory_lines = '\n'.join([f"  📁 {mount_key}/{d}/" for d in directories])
+            result_parts.append(f"Directories ({len(directories)}):\n{directory_lines}")
         if files:
-            result_parts.append(f"Files ({len(files)}):\n" + '\n'.join(f"  📄 {mount_key}/{f}" for f in files))
+            file_lines = '\n'.join([f"  📄 {mount_key}/{f}" for f in files])
+            result_parts.append(f"Files ({len(files)}):\n{file_lines}")
         if truncated:
             result_parts.append(f"... truncated to {max_results} results. Narrow your path or disable recursion.")
 
@@ -1018,10 +1256,14 @@ Full documentation:
             'rg',
             '--no-heading',
             '--with-filename',
+            '--null',
             '--line-number',
             '--color',
             'never',
             '--ignore-case',
+            '--max-columns',
+            str(_SEARCH_MAX_COLUMNS),
+            '--max-columns-preview',
         ]
 
         search_roots = [vault_abs]
@@ -1030,7 +1272,7 @@ Full documentation:
 
         path = path.strip()
         if path:
-            if '..' in path or path.startswith('/'):
+            if has_parent_reference(path) or path.startswith('/'):
                 return cls._result(
                     message="Path cannot contain '..' or start with '/'",
                     operation="search",
@@ -1051,10 +1293,7 @@ Full documentation:
                     abs_scope = root_abs
 
                 if os.path.isdir(abs_scope):
-                    if (
-                        not abs_scope.startswith(root_abs + os.sep)
-                        and abs_scope != root_abs
-                    ):
+                    if not is_within_root(abs_scope, root_abs):
                         return cls._result(
                             message="Path escapes virtual mount boundaries",
                             operation="search",
@@ -1065,10 +1304,7 @@ Full documentation:
                         )
                     search_roots = [abs_scope]
                 elif os.path.isfile(abs_scope):
-                    if (
-                        not abs_scope.startswith(root_abs + os.sep)
-                        and abs_scope != root_abs
-                    ):
+                    if not is_within_root(abs_scope, root_abs):
                         return cls._result(
                             message="Path escapes virtual mount boundaries",
                             operation="search",
@@ -1085,10 +1321,7 @@ Full documentation:
             else:
                 abs_scope = os.path.realpath(os.path.join(vault_abs, path))
                 if os.path.isdir(abs_scope):
-                    if (
-                        not abs_scope.startswith(vault_abs + os.sep)
-                        and abs_scope != vault_abs
-                    ):
+                    if not is_within_root(abs_scope, vault_abs):
                         return cls._result(
                             message="Path escapes vault boundaries",
                             operation="search",
@@ -1099,10 +1332,7 @@ Full documentation:
                         )
                     search_roots = [abs_scope]
                 elif os.path.isfile(abs_scope):
-                    if (
-                        not abs_scope.startswith(vault_abs + os.sep)
-                        and abs_scope != vault_abs
-                    ):
+                    if not is_within_root(abs_scope, vault_abs):
                         return cls._result(
                             message="Path escapes vault boundaries",
                             operation="search",
@@ -1128,18 +1358,22 @@ Full documentation:
         rg_cmd.append(search_term)
         rg_cmd.extend(search_roots)
 
+        max_results = get_file_ops_safe_search_max_results()
         try:
-            result = subprocess.run(
+            raw_lines, truncated, returncode, stderr = cls._run_ripgrep(
                 rg_cmd,
-                capture_output=True,
-                text=True,
-                timeout=get_file_search_timeout_seconds(),
+                max_results=max_results,
+                timeout_seconds=get_file_search_timeout_seconds(),
             )
 
-            if result.returncode == 0:
+            if truncated or returncode == 0:
                 lines = []
-                for raw_line in result.stdout.splitlines():
-                    file_path, sep, remainder = raw_line.partition(':')
+                # rg emits matches grouped by file; resolve each path once.
+                rel_paths: dict[str, str] = {}
+                base_prefix = result_base_root + os.sep
+                base_prefix_len = len(base_prefix)
+                for raw_line in raw_lines:
+                    file_path, sep, remainder = raw_line.partition('\0')
                     if not sep:
                         lines.append(raw_line)
                         continue
@@ -1148,19 +1382,32 @@ Full documentation:
                         lines.append(raw_line)
                         continue
 
-                    file_abs = os.path.realpath(file_path)
-                    try:
-                        rel_path = os.path.relpath(file_abs, result_base_root)
-                    except ValueError:
-                        rel_path = file_path
-                    if rel_path == ".":
-                        rel_path = os.path.basename(file_path)
-                    if result_prefix:
-                        rel_path = f"{result_prefix}/{rel_path}"
+                    rel_path = rel_paths.get(file_path)
+                    if rel_path is None:
+                        if file_path.startswith(base_prefix):
+                            # Search roots are already realpaths under the base root.
+                            rel_path = file_path[base_prefix_len:]
+                        else:
+                            file_abs = os.path.realpath(file_path)
+                            try:
+                                rel_path = os.path.relpath(file_abs, result_base_root)
+                            except ValueError:
+                                rel_path = file_path
+                            if rel_path == ".":
+                                rel_path = os.path.basename(file_path)
+                        if result_prefix:
+                            rel_path = f"{result_prefix}/{rel_path}"
+                        rel_paths[file_path] = rel_path
                     lines.append(f"{rel_path}:{line_no}:{line_content}")
 
+                message = f"Found {len(lines)} matches:\n\n" + '\n'.join(lines)
+                if truncated:
+                    message += (
+                        f"\n\n... truncated to {max_results} matches. "
+                        "Narrow your path or search_term."
+                    )
                 return cls._result(
-                    message=f"Found {len(lines)} matches:\n\n" + '\n'.join(lines),
+                    message=message,
                     operation="search",
                     path=path,
                     search_term=search_term,
@@ -1169,9 +1416,10 @@ Full documentation:
                     metadata={
                         "match_count": len(lines),
                         "matches": lines,
+                        "truncated": truncated,
                     },
                 )
-            elif result.returncode == 1:
+            elif returncode == 1:
                 return cls._result(
                     message=f"No matches found for '{search_term}' in text files",
                     operation="search",
@@ -1183,7 +1431,7 @@ Full documentation:
                 )
             else:
                 return cls._result(
-                    message=f"Search error: {result.stderr or 'Unknown error'}",
+                    message=f"Search error: {stderr or 'Unknown error'}",
                     operation="search",
                     path=path,
                     search_term=search_term,
@@ -1219,24 +1467,75 @@ Full documentation:
                 error_type=type(e).__name__,
             )
 
+    @staticmethod
+    def _run_ripgrep(
+        rg_cmd: list[str],
+        *,
+        max_results: int,
+        timeout_seconds: float,
+    ) -> tuple[list[str], bool, int, str]:
+        """Stream ripgrep output, stopping the process once max_results lines are read.
+
+        Returns (lines, truncated, returncode, stderr). Raises
+        subprocess.TimeoutExpired when the search outlives timeout_seconds.
+        """
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(
+                rg_cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+            timed_out = threading.Event()
+
+            def _kill_on_timeout() -> None:
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(timeout_seconds, _kill_on_timeout)
+            watchdog.start()
+            lines: list[str] = []
+            truncated = False
+            try:
+                for raw_line in proc.stdout:
+                    if max_results > 0 and len(lines) >= max_results:
+                        truncated = True
+                        break
+                    lines.append(raw_line.rstrip("\n"))
+                if truncated:
+                    proc.kill()
+                returncode = proc.wait()
+            except BaseException:
+                proc.kill()
+                proc.wait()
+                raise
+            finally:
+                watchdog.cancel()
+                proc.stdout.close()
+
+            if timed_out.is_set() and not truncated:
+                raise subprocess.TimeoutExpired(rg_cmd, timeout_seconds)
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+        return lines, truncated, returncode, stderr
+
     @classmethod
     def _resolve_search_glob_roots(cls, root_abs: str, pattern: str) -> list[str]:
         """Resolve an explicit vault-relative search glob into bounded, non-hidden roots."""
         if not pattern:
             return [root_abs]
-        matches: list[str] = []
-        full_pattern = os.path.join(root_abs, pattern)
-        for match in glob.iglob(full_pattern, recursive="**" in pattern):
-            match_abs = os.path.abspath(match)
-            resolved = os.path.realpath(match_abs)
-            if not resolved.startswith(root_abs + os.sep) and resolved != root_abs:
-                continue
-            rel = os.path.relpath(match_abs, root_abs)
-            if rel == ".":
-                continue
-            if any(part.startswith(".") for part in rel.split(os.sep) if part):
-                continue
-            matches.append(resolved)
+        # The walker resolves literal segments with a single lstat, so deep
+        # literal prefixes such as 'notes/sub/*.md' only scan 'notes/sub'.
+        matches = [
+            os.path.realpath(os.path.join(root_abs, relative_path))
+            for relative_path, _is_dir in cls._iter_glob_entries(
+                root_abs,
+                pattern,
+                recursive="**" in pattern,
+            )
+        ]
         return sorted(dict.fromkeys(matches))
 
     @classmethod
@@ -1246,10 +1545,10 @@ Full documentation:
         if not path or path == ".":
             path = "*"
 
-        if '..' in path or path.startswith('/'):
+        if has_parent_reference(path) or path.startswith('/'):
             raise ValueError("Path cannot contain '..' or start with '/'")
 
-        is_glob = any(ch in path for ch in "*?[")
+        is_glob = not _GLOB_CHARS.isdisjoint(path)
         if not is_glob:
             abs_path = os.path.join(vault_path, path)
             if os.path.isdir(abs_path):
@@ -1259,14 +1558,16 @@ Full documentation:
         matches = sorted(glob.glob(full_pattern, recursive=False))
 
         vault_abs = os.path.realpath(vault_path)
+        vault_prefix = vault_abs + os.sep
+        vault_prefix_len = len(vault_prefix)
         md_files: list[tuple[str, str]] = []
         for match in matches:
             if not match.endswith(".md"):
                 continue
             abs_match = os.path.realpath(match)
-            if not abs_match.startswith(vault_abs + os.sep):
+            if not abs_match.startswith(vault_prefix):
                 continue
-            rel = abs_match[len(vault_abs) + 1:]
+            rel = abs_match[vault_prefix_len:]
             if any(part.startswith('.') for part in rel.split(os.sep)):
                 continue
             md_files.append((rel, abs_match))
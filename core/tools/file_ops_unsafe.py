@@ -7,6 +7,7 @@ Provides file editing, deletion, and overwrite capabilities within vault boundar
 """
 
 import os
+import stat
 from typing import Any
 
 from pydantic_ai.messages import ToolReturn
@@ -40,6 +41,13 @@ class FileOpsUnsafe(BaseTool):
         :param vault_path: Path to vault for file operations scope
         """
 
+        # Invocation log fields are fixed per tool instance; build them once.
+        validation_log = logger.set_sinks(["validation"])
+        invocation_data = {
+            "tool": "file_ops_unsafe",
+            "vault": vault_path.rstrip("/").split("/")[-1] if vault_path else None,
+        }
+
         def file_ops_unsafe(
             *,
             operation: str,
@@ -63,13 +71,7 @@ class FileOpsUnsafe(BaseTool):
             :param destination: Destination path for move_overwrite
             """
             try:
-                logger.set_sinks(["validation"]).info(
-                    "tool_invoked",
-                    data={
-                        "tool": "file_ops_unsafe",
-                        "vault": vault_path.rstrip("/").split("/")[-1] if vault_path else None,
-                    },
-                )
+                validation_log.info("tool_invoked", data=invocation_data)
                 if not vault_path:
                     raise ValueError("vault_path is required for file operations")
 
@@ -166,17 +168,6 @@ Full documentation:
         """Edit a specific line in a file with exact match validation."""
         effective_path, full_path = cls._resolve_markdown_text_target(path, vault_path)
 
-        if not os.path.exists(full_path):
-            return cls._result(
-                message=f"Cannot edit '{effective_path}' - file does not exist",
-                operation="edit_line",
-                path=effective_path,
-                status="not_found",
-                exists=False,
-                error_type="file_not_found",
-                metadata=cls._requested_path_metadata(path, effective_path),
-            )
-
         if line_number < 1:
             return cls._result(
                 message=f"Invalid line_number {line_number} - must be >= 1",
@@ -188,8 +179,20 @@ Full documentation:
                 metadata=cls._requested_path_metadata(path, effective_path),
             )
 
-        # Read all lines
-        with open(full_path, 'r', encoding='utf-8', newline='') as file:
+        # Read all lines; a missing file surfaces from the open itself.
+        try:
+            file = open(full_path, 'r', encoding='utf-8', newline='')
+        except (FileNotFoundError, NotADirectoryError):
+            return cls._result(
+                message=f"Cannot edit '{effective_path}' - file does not exist",
+                operation="edit_line",
+                path=effective_path,
+                status="not_found",
+                exists=False,
+                error_type="file_not_found",
+                metadata=cls._requested_path_metadata(path, effective_path),
+            )
+        with file:
             lines = file.readlines()
 
         # Validate line number
@@ -273,7 +276,9 @@ Full documentation:
 
         full_path = validate_and_resolve_path(path, vault_path, markdown_only=False)
 
-        if not os.path.exists(full_path):
+        try:
+            stat_result = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
             return cls._result(
                 message=f"Cannot delete '{path}' - file does not exist",
                 operation="delete",
@@ -283,7 +288,7 @@ Full documentation:
                 error_type="file_not_found",
             )
 
-        if os.path.isdir(full_path):
+        if stat.S_ISDIR(stat_result.st_mode):
             return cls._delete_empty_directory_tree(path, vault_path)
 
         try:
@@ -387,17 +392,6 @@ Full documentation:
         """Replace text in file with limited count."""
         effective_path, full_path = cls._resolve_markdown_text_target(path, vault_path)
 
-        if not os.path.exists(full_path):
-            return cls._result(
-                message=f"Cannot replace text in '{effective_path}' - file does not exist",
-                operation="replace_text",
-                path=effective_path,
-                status="not_found",
-                exists=False,
-                error_type="file_not_found",
-                metadata=cls._requested_path_metadata(path, effective_path),
-            )
-
         if count < 1:
             return cls._result(
                 message=f"Invalid count {count} - must be >= 1",
@@ -409,12 +403,27 @@ Full documentation:
                 metadata=cls._requested_path_metadata(path, effective_path),
             )
 
-        # Read file
-        with open(full_path, 'r', encoding='utf-8') as file:
+        # Read file; a missing file surfaces from the open itself.
+        try:
+            file = open(full_path, 'r', encoding='utf-8')
+        except (FileNotFoundError, NotADirectoryError):
+            return cls._result(
+                message=(
+                    f"Cannot replace text in '{effective_path}' - file does not exist"
+                ),
+                operation="replace_text",
+                path=effective_path,
+                status="not_found",
+                exists=False,
+                error_type="file_not_found",
+                metadata=cls._requested_path_metadata(path, effective_path),
+            )
+        with file:
             content = file.read()
 
-        # Check if old_text exists
-        if old_text not in content:
+        # Count once; the result doubles as the existence check.
+        occurrences = content.count(old_text)
+        if not occurrences:
             return cls._result(
                 message=f"Text not found in '{effective_path}': '{old_text}'",
                 operation="replace_text",
@@ -428,8 +437,7 @@ Full documentation:
         # Replace with count limit
         new_content = content.replace(old_text, new_text, count)
 
-        # Count actual replacements
-        replacements = content.count(old_text) if count >= content.count(old_text) else count
+        replacements = min(occurrences, count)
 
         mutation = replace_vault_file_content(
             vault_path=vault_path,
@@ -520,7 +528,9 @@ Full documentation:
 
         effective_path, full_path = cls._resolve_markdown_text_target(path, vault_path)
 
-        if not os.path.exists(full_path):
+        try:
+            stat_result = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
             return cls._result(
                 message=f"Cannot truncate '{effective_path}' - file does not exist",
                 operation="truncate",
@@ -531,7 +541,7 @@ Full documentation:
                 metadata=cls._requested_path_metadata(path, effective_path),
             )
 
-        if os.path.isdir(full_path):
+        if stat.S_ISDIR(stat_result.st_mode):
             return cls._result(
                 message=f"Cannot truncate '{effective_path}' - this is a directory, not a file",
                 operation="truncate",
@@ -5,9 +5,21 @@ Provides security validation and path resolution for all file operations.
 """
 
 import os
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
 import tiktoken
 from core.constants import VIRTUAL_MOUNTS
+from core.utils.paths import has_parent_reference, is_within_root
+
+
+# Token counts keyed by (encoding name, content digest); bounded LRU.
+_TOKEN_COUNT_CACHE_MAX_ENTRIES = 256
+_token_count_cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+
+# Minimum characters per encode call when counting against a limit.
+_TOKEN_LIMIT_CHUNK_CHARS = 16_384
 
 
 def _normalize_virtual_path(path: str) -> str:
@@ -30,6 +42,23 @@ def is_virtual_docs_path(path: str) -> bool:
     return get_virtual_mount_key(path) == "__virtual_docs__"
 
 
+@lru_cache(maxsize=None)
+def _resolve_mount_root(root: str) -> Path:
+    """Resolve a virtual mount root once; mount roots are fixed at import time."""
+    return Path(root).resolve()
+
+
+@lru_cache(maxsize=64)
+def resolve_vault_root(vault_path: str) -> str:
+    """Return the realpath of a vault root, cached per process.
+
+    Only the root is cached; target paths are always resolved fresh. If a
+    vault root symlink is retargeted at runtime, containment checks fail
+    closed against the old root rather than admitting paths outside it.
+    """
+    return os.path.realpath(vault_path)
+
+
 def resolve_virtual_path(path: str) -> tuple[str, dict]:
     """Resolve a virtual mount path to an absolute path and mount metadata."""
     mount_key = get_virtual_mount_key(path)
@@ -37,13 +66,16 @@ def resolve_virtual_path(path: str) -> tuple[str, dict]:
         raise ValueError("Not a virtual mount path")
 
     mount = VIRTUAL_MOUNTS[mount_key]
-    root = Path(mount["root"]).resolve()
+    root = _resolve_mount_root(mount["root"])
 
     normalized = _normalize_virtual_path(path)
     rel = normalized[len(mount_key):].lstrip("/")
 
-    if ".." in rel.split(os.sep):
+    if has_parent_reference(rel):
         raise ValueError("Path traversal not allowed in virtual mount path")
+    if not rel:
+        # The mount root itself is already resolved and cached.
+        return str(root), mount
 
     candidate = (root / rel).resolve()
     try:
@@ -78,7 +110,7 @@ def validate_and_resolve_path(path: str, vault_path: str, *, markdown_only: bool
     mount_key = get_virtual_mount_key(path)
     if mount_key:
         raise ValueError(f"'{mount_key}' is reserved for a virtual mount")
-    if '..' in path:
+    if has_parent_reference(path):
         raise ValueError("Path traversal not allowed - '..' found in path")
 
     if path.startswith('/'):
@@ -93,19 +125,28 @@ def validate_and_resolve_path(path: str, vault_path: str, *, markdown_only: bool
     # Use realpath to collapse symlinks before boundary checks.
     full_path = os.path.join(vault_path, path)
     resolved_path = os.path.realpath(full_path)
-    vault_abs = os.path.realpath(vault_path)
+    vault_abs = resolve_vault_root(vault_path)
 
     # Ensure the resolved path is within vault boundaries after symlink resolution.
-    if not resolved_path.startswith(vault_abs + os.sep) and resolved_path != vault_abs:
+    if not is_within_root(resolved_path, vault_abs):
         raise ValueError("Path escapes vault boundaries")
 
     return resolved_path
 
 
+@lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoding for a name, built once per process."""
+    return tiktoken.get_encoding(encoding_name)
+
+
 def estimate_token_count(text: str, encoding_name: str = "cl100k_base") -> int:
     """
     Estimate token count for text using tiktoken.
 
+    Counts are cached by content digest, so repeated estimates for the same
+    text skip re-encoding.
+
     Args:
         text: The text content to count tokens for
         encoding_name: The tiktoken encoding to use (default: cl100k_base for GPT-4/Claude-like models)
@@ -119,8 +160,64 @@ def estimate_token_count(text: str, encoding_name: str = "cl100k_base") -> int:
         - Claude models (approximate)
         - Most modern LLMs
     """
-    encoding = tiktoken.get_encoding(encoding_name)
-    return len(encoding.encode(text))
+    digest = blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    key = (encoding_name, digest)
+    cached = _token_count_cache.get(key)
+    if cached is not None:
+        try:
+            _token_count_cache.move_to_end(key)
+        except KeyError:
+            pass
+        return cached
+
+    encoding = _get_encoding(encoding_name)
+    count = len(encoding.encode(text))
+    _token_count_cache[key] = count
+    while len(_token_count_cache) > _TOKEN_COUNT_CACHE_MAX_ENTRIES:
+        try:
+            _token_count_cache.popitem(last=False)
+        except KeyError:
+            break
+    return count
+
+
+def token_count_upper_bound(text: str) -> int:
+    """Return a cheap upper bound on the tiktoken count for text.
+
+    tiktoken encodings are byte-level BPE, so every token covers at least one
+    UTF-8 byte. When the bound is within a limit the text cannot exceed it,
+    and the full encode can be skipped.
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8", "surrogatepass"))
+
+
+def count_tokens_up_to(
+    text: str, limit: int, encoding_name: str = "cl100k_base"
+) -> int:
+    """Estimate token count, stopping early once it exceeds limit.
+
+    Text that cannot exceed the limit is counted whole. Otherwise it is
+    encoded in paragraph-aligned chunks and the running total is returned as
+    soon as it passes the limit, so the result is only meaningful as
+    ``<= limit`` or ``> limit`` for oversized inputs.
+    """
+    if limit <= 0 or token_count_upper_bound(text) <= limit:
+        return estimate_token_count(text, encoding_name)
+
+    encoding = _get_encoding(encoding_name)
+    total = 0
+    start = 0
+    text_length = len(text)
+    while start < text_length:
+        end = text.find("\n\n", start + _TOKEN_LIMIT_CHUNK_CHARS)
+        end = text_length if end == -1 else end + 2
+        total += len(encoding.encode(text[start:end]))
+        if total > limit:
+            break
+        start = end
+    return total
 
 
 def get_tool_instructions(tools):
@@ -0,0 +1,24 @@
+"""Path containment and traversal checks shared by the tools and vault state."""
+
+from __future__ import annotations
+
+import os
+
+
+def is_within_root(path: str, root: str) -> bool:
+    """Return True when an absolute path is the root itself or sits below it.
+
+    Compares against ``root + os.sep`` so sibling names sharing a prefix
+    (``/vault-other`` vs ``/vault``) are not treated as contained.
+    """
+    return path == root or path.startswith(root + os.sep)
+
+
+def has_parent_reference(path: str) -> bool:
+    """Return True when any path segment is '..'.
+
+    Both '/' and '\\' count as separators. Names that merely contain '..'
+    (``notes/v1..v2.md``) are allowed; the realpath containment check remains
+    the boundary guard.
+    """
+    return ".." in path.replace("\\", "/").split("/")
@@ -7,7 +7,9 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 import os
 from pathlib import Path
+import stat
 from typing import Any
+import uuid
 
 from core.logger import UnifiedLogger
 from core.runtime.execution_tasks import get_current_execution_task, goal_context_from_metadata
@@ -25,7 +27,6 @@ from core.vault_state.snapshots import (
 
 logger = UnifiedLogger(tag="vault-mutations")
 
-
 class VaultMutationRejected(Exception):
     """Raised when a requested vault mutation is rejected or cannot be recorded safely."""
 
@@ -81,11 +82,24 @@ def write_vault_file(
     warn_without_task: bool = True,
 ) -> RecordedMutationResult:
     """Create or overwrite a vault file while recording task mutation metadata."""
+
+    def write_content(full_path: Path) -> None:
+        if not fail_if_exists:
+            _write_text_atomic(full_path, content)
+            return
+        # Exclusive create closes the gap between the existence check and the write.
+        try:
+            file = full_path.open("x", encoding="utf-8")
+        except FileExistsError as exc:
+            raise _file_exists_rejection(path) from exc
+        with file:
+            file.write(content)
+
     return mutate_vault_file(
         vault_path=vault_path,
         path=path,
         operation="write",
-        mutator=lambda full_path: full_path.write_text(content, encoding="utf-8"),
+        mutator=write_content,
         fail_if_exists=fail_if_exists,
         markdown_only=markdown_only,
         create_parent=True,
@@ -102,11 +116,21 @@ def write_vault_file_bytes(
     warn_without_task: bool = True,
 ) -> RecordedMutationResult:
     """Create or overwrite a binary vault file while recording mutation metadata."""
+    open_mode = "xb" if fail_if_exists else "wb"
+
+    def write_content(full_path: Path) -> None:
+        try:
+            file = full_path.open(open_mode)
+        except FileExistsError as exc:
+            raise _file_exists_rejection(path) from exc
+        with file:
+            file.write(content)
+
     return mutate_vault_file(
         vault_path=vault_path,
         path=path,
         operation="write",
-        mutator=lambda full_path: full_path.write_bytes(content),
+        mutator=write_content,
         fail_if_exists=fail_if_exists,
         create_parent=True,
         warn_without_task=warn_without_task,
@@ -123,8 +147,18 @@ def append_vault_file(
     """Append text to an existing vault file while recording mutation metadata."""
 
     def append_content(full_path: Path) -> None:
-        with full_path.open("a", encoding="utf-8") as file:
-            file.write(content)
+        # Open without O_CREAT so a file removed after the existence check stays gone.
+        try:
+            fd = os.open(full_path, os.O_WRONLY | os.O_APPEND)
+        except FileNotFoundError as exc:
+            raise _file_not_found_rejection(path) from exc
+        # Write the encoded bytes straight to the fd; no text-wrapper buffer per append.
+        try:
+            data = memoryview(content.encode("utf-8"))
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
 
     return mutate_vault_file(
         vault_path=vault_path,
@@ -147,7 +181,7 @@ def replace_vault_file_content(
     """Replace the full contents of an existing vault file and record the mutation."""
 
     def write_content(full_path: Path) -> None:
-        full_path.write_text(content, encoding="utf-8")
+        _write_text_atomic(full_path, content)
 
     return mutate_vault_file(
         vault_path=vault_path,
@@ -358,8 +392,14 @@ def move_vault_file(
                 session.commit()
 
         stage = "mutate"
-        destination_path.parent.mkdir(parents=True, exist_ok=True)
-        os.replace(source_path, destination_path)
+        try:
+            os.replace(source_path, destination_path)
+        except FileNotFoundError:
+            # Only a missing destination parent is recoverable, not a vanished source.
+            if destination_path.parent.exists():
+                raise
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source_path, destination_path)
 
         destination_after_hash = hash_file_bytes(destination_path, length=None)
         stage = "refresh"
@@ -459,15 +499,9 @@ def mutate_vault_file(
     )
     before_exists = full_path.exists()
     if require_exists and not before_exists:
-        raise VaultMutationRejected(
-            "file_not_found",
-            f"Cannot mutate '{relative_path}' - file does not exist.",
-        )
+        raise _file_not_found_rejection(relative_path)
     if before_exists and fail_if_exists:
-        raise VaultMutationRejected(
-            "file_exists",
-            f"Cannot mutate '{relative_path}' - file already exists.",
-        )
+        raise _file_exists_rejection(relative_path)
     before_hash = hash_file_bytes(full_path, length=None) if before_exists else None
     identity = resolve_or_create_vault_identity(vault_root)
     vault_name = vault_root.name
@@ -508,9 +542,15 @@ def mutate_vault_file(
                 session.commit()
 
         stage = "mutate"
-        if create_parent:
+        try:
+            mutator(full_path)
+        except FileNotFoundError:
+            # Parents usually exist, so only create them after the first attempt misses.
+            # Any other FileNotFoundError from the mutator propagates unchanged.
+            if not create_parent or full_path.parent.exists():
+                raise
             full_path.parent.mkdir(parents=True, exist_ok=True)
-        mutator(full_path)
+            mutator(full_path)
 
         after_exists = full_path.exists()
         after_hash = hash_file_bytes(full_path, length=None) if after_exists else None
@@ -569,6 +609,52 @@ def mutate_vault_file(
     return result
 
 
+def _write_text_atomic(full_path: Path, content: str) -> None:
+    """Write text via a synced hidden temp file so the target is never left partial.
+
+    The temp file is created 0666 under the current umask; an existing target's
+    mode is copied onto it before the replace.
+    """
+    temp_path = full_path.with_name(f".{full_path.name}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    replaced = False
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+            try:
+                mode = stat.S_IMODE(os.stat(full_path).st_mode)
+            except FileNotFoundError:
+                mode = None
+            if mode is not None:
+                os.fchmod(handle.fileno(), mode)
+        os.replace(temp_path, full_path)
+        replaced = True
+    finally:
+        if not replaced:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+
+
+def _file_not_found_rejection(path: str) -> VaultMutationRejected:
+    relative_path = normalize_vault_relative_path(path)
+    return VaultMutationRejected(
+        "file_not_found",
+        f"Cannot mutate '{relative_path}' - file does not exist.",
+    )
+
+
+def _file_exists_rejection(path: str) -> VaultMutationRejected:
+    relative_path = normalize_vault_relative_path(path)
+    return VaultMutationRejected(
+        "file_exists",
+        f"Cannot mutate '{relative_path}' - file already exists.",
+    )
+
+
 def _log_mutation_failed(
     *,
     task: Any,
@@ -5,6 +5,8 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+from core.utils.paths import has_parent_reference
+
 
 def resolve_vault_relative_path(
     *,
@@ -13,7 +15,7 @@ def resolve_vault_relative_path(
     markdown_only: bool = False,
 ) -> Path:
     """Resolve a vault-relative path while enforcing vault boundaries."""
-    if ".." in path:
+    if has_parent_reference(path):
         raise ValueError("Path traversal not allowed - '..' found in path")
     if path.startswith("/"):
         raise ValueError("Absolute paths not allowed")
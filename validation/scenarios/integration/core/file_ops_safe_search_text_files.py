@@ -5,12 +5,16 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
 
+from core.settings import get_file_ops_safe_search_max_results
 from core.tools.file_ops_safe import FileOpsSafe
 from validation.core.base_scenario import BaseScenario
 
 
 class FileOpsSafeSearchTextFilesScenario(BaseScenario):
-    """Validate search is not limited to markdown after all-file listing support."""
+    """Validate search is not limited to markdown after all-file listing support.
+
+    Also guards the per-segment '..' rule shared by read, write, and search.
+    """
 
     async def test_scenario(self):
         vault = self.create_vault("FileOpsSafeSearchTextFilesVault")
@@ -19,8 +23,14 @@ class FileOpsSafeSearchTextFilesScenario(BaseScenario):
         self.create_file(vault, "notes/charlie.json", '{"value": "needle in json"}\n')
         self.create_file(vault, "notes/.hidden.txt", "needle hidden\n")
         self.create_file(vault, "notes/nomatch.txt", "nothing here\n")
+        self.create_file(
+            vault,
+            "bulk/many.txt",
+            "".join(f"haystack line {index}\n" for index in range(1000)),
+        )
 
         await self.start_system()
+        search_cap = get_file_ops_safe_search_max_results()
 
         broad = FileOpsSafe._search_files("notes", "needle", str(vault))
         broad_matches = set(broad.metadata.get("matches") or [])
@@ -45,6 +55,36 @@ class FileOpsSafeSearchTextFilesScenario(BaseScenario):
             not any(".hidden.txt" in match for match in broad_matches),
             "Search should continue to exclude hidden files by default",
         )
+        self.soft_assert_equal(
+            broad.metadata.get("truncated"),
+            False,
+            "Search under the match cap should not report truncation",
+        )
+
+        self.soft_assert(
+            0 < search_cap < 1000,
+            "Search match cap should be enabled and below the bulk fixture size",
+        )
+        capped = FileOpsSafe._search_files("bulk", "haystack", str(vault))
+        self.soft_assert_equal(
+            capped.metadata.get("match_count"),
+            search_cap,
+            "Search should stop at file_ops_safe_search_max_results matches",
+        )
+        self.soft_assert_equal(
+            len(capped.metadata.get("matches") or []),
+            search_cap,
+            "Capped search should return exactly the capped match list",
+        )
+        self.soft_assert_equal(
+            capped.metadata.get("truncated"),
+            True,
+            "Capped search should report truncation in metadata",
+        )
+        self.soft_assert(
+            f"truncated to {search_cap} matches" in (capped.return_value or ""),
+            "Capped search output should tell the caller results were truncated",
+        )
 
         explicit_file = FileOpsSafe._search_files("notes/bravo.txt", "needle", str(vault))
         self.soft_assert(
@@ -66,6 +106,39 @@ class FileOpsSafeSearchTextFilesScenario(BaseScenario):
             "Explicit glob search should respect the caller's file pattern",
         )
 
+        file_ops = FileOpsSafe.get_tool(str(vault)).function
+        dotted_write = file_ops(
+            operation="write",
+            path="notes/v1..v2.md",
+            content="needle in dotted name\n",
+        )
+        self.soft_assert_equal(
+            dotted_write.metadata.get("status"),
+            "completed",
+            "Names that merely contain '..' should be writable",
+        )
+        dotted_read = file_ops(operation="read", path="notes/v1..v2.md")
+        self.soft_assert_equal(
+            dotted_read.metadata.get("status"),
+            "completed",
+            "Names that merely contain '..' should be readable",
+        )
+        self.soft_assert(
+            "needle in dotted name" in (dotted_read.return_value or ""),
+            "Reading a dotted name should return the written content",
+        )
+        for traversal_path in ("notes/../x.md", "notes\\..\\x.md"):
+            traversal = file_ops(operation="read", path=traversal_path)
+            self.soft_assert_equal(
+                traversal.metadata.get("status"),
+                "error",
+                f"A '..' segment should still be rejected: {traversal_path}",
+            )
+            self.soft_assert(
+                "Path traversal not allowed" in (traversal.return_value or ""),
+                f"Rejection should name path traversal: {traversal_path}",
+            )
+
         miss = FileOpsSafe._search_files("notes", "absent", str(vault))
         self.soft_assert_equal(
             miss.return_value,